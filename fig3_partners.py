@@ -0,0 +1,8 @@
+# Kept so `python fig3_partners.py partners.csv` still works;
+# see `python -m figtab --help`.
+import sys
+
+from figtab.cli import main
+
+csv_path = sys.argv[1] if len(sys.argv) > 1 else "partners.csv"
+sys.exit(main(["fig3_partners", "--data", csv_path, "--show"]))
@@ -0,0 +1,14 @@
+"""Figures for the Yuan Rung Hospital international-medicine paper.
+
+Each ``figtab.<name>`` module exposes ``OUTPUT``, ``FIGSIZE`` and
+``draw(fig, ...)``. Nothing heavy is imported here: Matplotlib and NumPy
+are loaded on the first render, so ``python -m figtab --help`` stays fast.
+"""
+
+__version__ = "0.1.0"
+
+# Rendered by default, in paper order
+FIGURES = ("fig1", "fig2", "fig3", "fig4")
+
+# Rendered only on request (need extra input such as --data)
+EXTRA_FIGURES = ("fig3_partners",)
@@ -0,0 +1,5 @@
+import sys
+
+from figtab.cli import main
+
+sys.exit(main())
@@ -0,0 +1,240 @@
+"""Command line entry point: ``python -m figtab [FIGURE ...]``.
+
+Only the standard library is imported at module level. Figure modules,
+NumPy and Matplotlib load lazily once a render starts, so short-lived batch
+workers do not pay for them on ``--help`` or a failed argument parse.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from figtab import EXTRA_FIGURES, FIGURES, __version__
+
+# Cold-start budget for importing the CLI and building its parser,
+# interpreter startup included (checked by --check-startup)
+STARTUP_BUDGET_S = 0.2
+
+# Must not be imported until a render actually starts
+HEAVY_MODULES = ("matplotlib", "numpy")
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m figtab",
+        description="Render the paper figures.",
+    )
+    parser.add_argument(
+        "figures", nargs="*", metavar="FIGURE",
+        help=f"figures to render (default: {' '.join(FIGURES)}; "
+             f"also: {' '.join(EXTRA_FIGURES)})",
+    )
+    parser.add_argument("--dpi", type=float, default=None,
+                        help="output resolution (default: 300; 50 with --leak-check)")
+    parser.add_argument("--out-dir", default=".", help="output directory (default: .)")
+    parser.add_argument("--format", default="png", choices=("png", "svg", "pdf", "html"),
+                        help="output format (default: png); html is an interactive "
+                             "pan/zoom page, fig1 only")
+    parser.add_argument("--lean", action="store_true",
+                        help="merge same-styled shapes, simplify paths and share SVG styles")
+    parser.add_argument("--tolerance", type=float, default=None, metavar="PT",
+                        help="path simplification tolerance for --lean, in points (default: 0.5)")
+    parser.add_argument("--text-to-path", action="store_true",
+                        help="with --lean, draw text from shared glyph paths instead of live text")
+    parser.add_argument("--data", help="long-format CSV for fig3_partners")
+    parser.add_argument("--show", action="store_true",
+                        help="also open each figure in a window (ignored when headless)")
+    parser.add_argument("--draft", action="store_true",
+                        help="fast low-dpi preview written to <stem>.draft.<ext>: "
+                             "no antialiasing, square boxes, straight arrows")
+    parser.add_argument("--refine", action="store_true",
+                        help="with --draft, keep refining the same figures in the background; "
+                             "the --dpi pass writes the real output")
+    parser.add_argument("--leak-check", type=int, default=0, metavar="N",
+                        help="render each figure N times through one canvas pool and "
+                             "exit 1 if memory keeps growing")
+    parser.add_argument("--profile-imports", action="store_true",
+                        help="rerun the same command under -X importtime and report the slowest imports")
+    parser.add_argument("--check-startup", action="store_true",
+                        help=f"exit 1 if CLI cold start exceeds --startup-budget "
+                             f"or imports any of: {', '.join(HEAVY_MODULES)}")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_S, metavar="SECONDS",
+                        help=f"budget for --check-startup (default: {STARTUP_BUDGET_S})")
+    parser.add_argument("--version", action="version", version=f"figtab {__version__}")
+    return parser
+
+
+def _child_env():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def profile_imports(argv, top=15):
+    """Run ``python -m figtab argv`` under ``-X importtime`` and print a report."""
+    cmd = [sys.executable, "-X", "importtime", "-m", "figtab", *argv]
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, capture_output=True, text=True, env=_child_env())
+    wall = time.perf_counter() - start
+
+    rows = []
+    other = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        self_us, cum_us, name = int(fields[0]), int(fields[1]), fields[2]
+        # One leading space per nesting level beyond the top
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((cum_us, self_us, depth, name.strip()))
+
+    sys.stdout.write(proc.stdout)
+    sys.stderr.write("\n".join(other) + ("\n" if other else ""))
+
+    top_level = sorted((r for r in rows if r[2] == 0), reverse=True)
+    total_us = sum(r[0] for r in top_level)
+    print(f"\n⏱️  Import profile: {' '.join(argv) or '(default figures)'}")
+    print(f"    wall {wall * 1000:8.1f} ms | imports {total_us / 1000:8.1f} ms | {len(rows)} modules")
+    print(f"    {'cumulative':>12} {'self':>10}  module")
+    for cum_us, self_us, _, name in top_level[:top]:
+        print(f"    {cum_us / 1000:9.1f} ms {self_us / 1000:7.1f} ms  {name}")
+    return proc.returncode
+
+
+def measure_startup(runs=5):
+    """Time a cold CLI start in fresh interpreters.
+
+    Returns ``(best_seconds, eager)`` where ``eager`` lists the
+    ``HEAVY_MODULES`` imported at startup. Raises
+    :class:`subprocess.CalledProcessError` if the child fails.
+    """
+    code = (
+        "import sys\n"
+        "from figtab.cli import HEAVY_MODULES, build_parser\n"
+        "build_parser()\n"
+        "print(','.join(m for m in HEAVY_MODULES if m in sys.modules))\n"
+    )
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                              text=True, env=_child_env(), check=True)
+        best = min(best, time.perf_counter() - start)
+    return best, [m for m in proc.stdout.strip().split(",") if m]
+
+
+def check_startup(budget=STARTUP_BUDGET_S, runs=5):
+    """Report :func:`measure_startup`; return 1 if over budget or the child fails."""
+    try:
+        best, eager = measure_startup(runs)
+    except subprocess.CalledProcessError as exc:
+        print(f"❌ CLI failed to start:\n{exc.stderr}")
+        return 1
+
+    ok = best <= budget and not eager
+    print(f"{'✅' if ok else '❌'} CLI cold start: {best * 1000:.1f} ms "
+          f"(budget {budget * 1000:.0f} ms, best of {runs})")
+    if eager:
+        print(f"❌ Imported at startup: {', '.join(eager)}")
+    return 0 if ok else 1
+
+
+def leak_check(jobs, renders, dpi, fmt):
+    """Run :func:`figtab.pool.leak_check` per job; return 1 if any grows."""
+    from figtab import pool
+
+    status = 0
+    for name, _, options in jobs:
+        rss_mb, objects = pool.leak_check(
+            name, renders, dpi=pool.LEAK_DPI if dpi is None else dpi, fmt=fmt,
+            report=lambda i, mb: print(f"    {name}: {i}/{renders} renders, +{mb:.1f} MB", flush=True),
+            **options)
+        ok = rss_mb <= pool.LEAK_BUDGET_MB and objects <= pool.LEAK_BUDGET_OBJECTS
+        print(f"{'✅' if ok else '❌'} {name}: {renders} pooled renders, "
+              f"peak RSS +{rss_mb:.1f} MB (budget {pool.LEAK_BUDGET_MB}), "
+              f"objects {objects:+d} (budget {pool.LEAK_BUDGET_OBJECTS})")
+        status |= not ok
+    return status
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.profile_imports:
+        return profile_imports([a for a in argv if a != "--profile-imports"])
+    if args.check_startup:
+        return check_startup(args.startup_budget)
+
+    names = args.figures or list(FIGURES)
+    unknown = [n for n in names if n not in FIGURES + EXTRA_FIGURES]
+    if unknown:
+        parser.error(f"unknown figure(s): {', '.join(unknown)}")
+    if "fig3_partners" in names and not args.data:
+        parser.error("fig3_partners needs --data CSV")
+    if args.refine and not args.draft:
+        parser.error("--refine needs --draft")
+    if (args.tolerance is not None or args.text_to_path) and not args.lean:
+        parser.error("--tolerance and --text-to-path need --lean")
+    if args.draft and (args.lean or args.show):
+        parser.error("--draft cannot be combined with --lean or --show")
+    if args.format == "html":
+        if names != ["fig1"]:
+            parser.error("--format html is only available for fig1")
+        if args.draft or args.lean or args.leak_check:
+            parser.error("--format html cannot be combined with --draft, --lean or --leak-check")
+
+    # Everything below may import Matplotlib; pick the backend first
+    from figtab.render import output_path, render, use_headless_backend
+
+    headless = use_headless_backend()
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    jobs = [(name, output_path(name, args.format, args.out_dir),
+             {"data": args.data} if name == "fig3_partners" else {})
+            for name in names]
+
+    if args.leak_check:
+        return leak_check(jobs, args.leak_check, args.dpi, args.format)
+    if args.dpi is None:
+        args.dpi = 300
+
+    if args.draft:
+        from figtab.draft import DRAFT_DPI, render_drafts
+
+        def report(name, out, dpi):
+            mark = "📝" if dpi == DRAFT_DPI else ("✅" if dpi == args.dpi else "🔄")
+            print(f"{mark} {name} ({dpi:g} dpi): {out}", flush=True)
+
+        refining = render_drafts(jobs, args.format, args.refine, args.dpi, report)
+        if refining:
+            refining.join()
+            if refining.error:
+                print(f"❌ Refinement failed: {refining.error!r}")
+                return 1
+        return 0
+
+    save_options = dict(dpi=args.dpi, fmt=args.format, lean=args.lean,
+                        tolerance=args.tolerance, text_to_path=args.text_to_path)
+    if args.show and not headless:
+        for name, out, options in jobs:
+            render(name, out=out, show=True, **save_options, **options)
+            print(f"✅ {name}: {out}")
+        return 0
+
+    # One pool for the whole batch: same-sized figures reuse one canvas
+    from figtab.pool import CanvasPool
+
+    pool = CanvasPool()
+    for name, out, options in jobs:
+        pool.render(name, out, **save_options, **options)
+        print(f"✅ {name}: {out}")
+    return 0
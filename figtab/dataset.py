@@ -0,0 +1,112 @@
+"""Canonical dataset shared by all figures, stored as memory-mapped columns.
+
+Every column lives in ``figtab/data/<table>.<column>.npy``; those files are
+the only copy of the data. :func:`load` memory-maps them read-only once per
+process, so parallel render workers share the same page-cache pages instead
+of each parsing and copying the numbers. :func:`check` runs vectorized
+cross-figure consistency checks and :func:`load` refuses data that fails
+them.
+
+To change a value, rewrite its column (``np.save(column_path(...), ...)``)
+and run ``python -m figtab.dataset`` to check the result.
+``tools/build_dataset.py`` is the one-off script that created the files.
+"""
+
+import os
+import sys
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Columns each figure reads, per table
+SCHEMA = {
+    "network": ("year", "mou_cum", "physicians", "nurses_others"),   # Figure 3
+    "phases": ("id", "start", "end", "x", "color"),                   # Figure 2
+    "counts": ("name", "value"),                                      # Figure 1
+}
+
+_cache = None
+
+
+class Table(dict):
+    """Columns of one table; ``table.lookup("name", "value")`` for key/value tables."""
+
+    def lookup(self, key_column, value_column):
+        return dict(zip(self[key_column].tolist(), self[value_column].tolist()))
+
+
+def column_path(table, column):
+    """Path of the ``.npy`` file holding ``table.column``."""
+    return os.path.join(DATA_DIR, f"{table}.{column}.npy")
+
+
+def load():
+    """Memory-map every column read-only (once per process) and check it."""
+    global _cache
+    if _cache is None:
+        import numpy as np
+
+        data = {
+            table: Table((column, np.load(column_path(table, column), mmap_mode="r"))
+                         for column in columns)
+            for table, columns in SCHEMA.items()
+        }
+        problems = check(data)
+        if problems:
+            raise ValueError("inconsistent figure data:\n  " + "\n  ".join(problems))
+        _cache = data
+    return _cache
+
+
+def check(data):
+    """Return a list of consistency problems in ``data`` (empty if none)."""
+    import numpy as np
+
+    net, phases = data["network"], data["phases"]
+    counts = Table(data["counts"]).lookup("name", "value")
+    problems = []
+
+    def expect(ok, message):
+        if not ok:
+            problems.append(message)
+
+    for table, columns in SCHEMA.items():
+        lengths = {len(data[table][c]) for c in columns}
+        expect(len(lengths) == 1, f"{table}: columns have different lengths {sorted(lengths)}")
+    if problems:
+        return problems
+
+    year = net["year"]
+    expect(np.all(np.diff(year) == 1), "network.year is not consecutive")
+    expect(np.all(np.diff(net["mou_cum"]) >= 0), "network.mou_cum decreases")
+    expect(np.all(net["physicians"] >= 0) and np.all(net["nurses_others"] >= 0),
+           "network has negative trainee counts")
+
+    # Figure 1 partner count == Figure 3 cumulative MOU total
+    expect(net["mou_cum"][-1] == counts["mou_partners"],
+           f"Figure 1 shows {counts['mou_partners']} MOU partners, "
+           f"Figure 3 ends at {net['mou_cum'][-1]}")
+
+    # Figure 2 phases are ordered, non-overlapping and cover Figure 3
+    start, end = phases["start"], phases["end"]
+    expect(np.all(start <= end), "phases: start after end")
+    expect(np.all(start[1:] > end[:-1]), "phases overlap or are out of order")
+    expect(np.all(np.diff(phases["x"]) > 0), "phases.x is not increasing")
+    expect(len(np.unique(phases["id"])) == len(phases["id"]), "phases.id is not unique")
+    expect(year[0] >= start[0] and year[-1] <= end[-1],
+           f"Figure 3 years {year[0]}-{year[-1]} fall outside the "
+           f"Figure 2 timeline {start[0]}-{end[-1]}")
+    return problems
+
+
+def main():
+    try:
+        load()
+    except (OSError, ValueError) as exc:
+        print(f"❌ {exc}")
+        return 1
+    print("✅ Figure data is consistent")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Draft previews with optional progressive refinement to print quality.
+
+A draft is the real figure (same ``draw()``, same layout) saved at a low dpi
+with antialiasing off, square boxes, straight arrows and no tight-bbox pass.
+Drafts and intermediate refinements are written next to the output as
+``<stem>.draft.<ext>`` (:func:`draft_path`), so a preview never overwrites a
+finished figure. With refinement the same Figure objects are restored and
+re-saved at rising dpi in a background thread, each write replacing the
+draft atomically; only the final-dpi pass writes the real output, exactly as
+a normal render would, and then removes the draft.
+"""
+
+import os
+import threading
+
+from figtab.render import SAVE_KW, build_figure, save
+
+DRAFT_DPI = 50
+
+# Intermediate resolutions written before the final one
+REFINE_DPIS = (100,)
+
+
+def simplify(fig):
+    """Switch ``fig`` to cheap draft settings; return a function undoing it."""
+    from matplotlib.patches import FancyArrowPatch, FancyBboxPatch
+    from matplotlib.text import Text
+
+    undo = []
+
+    def square(patch):
+        style = patch.get_boxstyle()
+        undo.append((patch.set_boxstyle, style))
+        patch.set_boxstyle("square", pad=getattr(style, "pad", 0.3))
+
+    for artist in fig.findobj():
+        if hasattr(artist, "get_antialiased") and hasattr(artist, "set_antialiased"):
+            undo.append((artist.set_antialiased, artist.get_antialiased()))
+            artist.set_antialiased(False)
+        if isinstance(artist, FancyBboxPatch):
+            square(artist)
+        elif isinstance(artist, Text) and artist.get_bbox_patch() is not None:
+            square(artist.get_bbox_patch())
+        elif isinstance(artist, FancyArrowPatch):
+            undo.append((artist.set_connectionstyle, artist.get_connectionstyle()))
+            artist.set_connectionstyle("arc3")
+
+    def restore():
+        for setter, value in reversed(undo):
+            setter(value)
+
+    return restore
+
+
+def draft_path(out):
+    """Where previews of ``out`` are written: ``<stem>.draft.<ext>``."""
+    root, ext = os.path.splitext(out)
+    return f"{root}.draft{ext}"
+
+
+def _save_atomic(fig, out, write):
+    root, ext = os.path.splitext(out)
+    tmp = f"{root}.part{ext}"
+    try:
+        write(fig, tmp)
+        os.replace(tmp, out)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class Refinement(threading.Thread):
+    """Background refine pass; ``error`` is the exception that stopped it, or None."""
+
+    def __init__(self, work):
+        super().__init__(name="figtab-refine")
+        self._work = work
+        self.error = None
+
+    def run(self):
+        try:
+            self._work()
+        except Exception as exc:
+            self.error = exc
+
+
+def render_drafts(jobs, fmt="png", refine=False, final_dpi=300, report=None):
+    """Save a draft of every job, then optionally refine them in the background.
+
+    ``jobs`` is a list of ``(name, out, options)``. Previews go to
+    ``draft_path(out)``; ``out`` itself is only written by the final refine
+    pass. ``report(name, path, dpi)`` is called after every write. Returns
+    the :class:`Refinement` thread (already started) or None; after
+    ``join()`` check its ``error``.
+    """
+    report = report or (lambda name, out, dpi: None)
+
+    drafts = []
+    for name, out, options in jobs:
+        fig = build_figure(name, **options)
+        restore = simplify(fig)
+        preview = draft_path(out)
+        _save_atomic(fig, preview, lambda f, path: f.savefig(
+            path, format=fmt, dpi=DRAFT_DPI, facecolor=SAVE_KW["facecolor"]))
+        report(name, preview, DRAFT_DPI)
+        drafts.append((name, out, fig, restore))
+
+    if not refine:
+        return None
+
+    def refine_all():
+        for _, _, _, restore in drafts:
+            restore()
+        # Whole set at each level before moving up, so every preview improves
+        for dpi in [d for d in REFINE_DPIS if d < final_dpi]:
+            for name, out, fig, _ in drafts:
+                _save_atomic(fig, draft_path(out), lambda f, path: save(f, path, fmt, dpi))
+                report(name, draft_path(out), dpi)
+        for name, out, fig, _ in drafts:
+            _save_atomic(fig, out, lambda f, path: save(f, path, fmt, final_dpi))
+            os.remove(draft_path(out))
+            report(name, out, final_dpi)
+
+    thread = Refinement(refine_all)
+    thread.start()
+    return thread
@@ -0,0 +1,155 @@
+# Figure 2: The Timeline of Resilience & Expansion (2016-2026)
+#
+# Render with `python -m figtab fig2`. Phase years, positions and colors
+# come from the shared figtab.dataset table "phases" (labels are built from
+# start/end); the text below is keyed by the stable phases.id. Matplotlib is imported inside draw() so importing
+# this module stays cheap.
+
+OUTPUT = "Figure2_Timeline_Resilience_Expansion.png"
+FIGSIZE = (20, 10)
+
+
+def draw(fig):
+    """Draw Figure 2 onto the empty figure ``fig``."""
+    from matplotlib.patches import FancyBboxPatch, Circle
+
+    from figtab import dataset
+
+    # Create figure
+    ax = fig.subplots()
+    ax.set_xlim(0, 11)
+    ax.set_ylim(0, 11)  # Increased y limit
+    ax.axis('off')
+
+    # Draw main timeline (moved down)
+    timeline_y = 5
+    ax.plot([1, 10], [timeline_y, timeline_y], 'k-', linewidth=3, zorder=1)
+
+    # Timeline milestones (years, x position, color) for each phase
+    phases = dataset.load()["phases"]
+    labels = [f"{s}" if s == e else f"{s}-{e}"
+              for s, e in zip(phases['start'].tolist(), phases['end'].tolist())]
+
+    # Milestone data, keyed by phases.id
+    milestone_data = {
+        'initiation': {
+            'name': 'Initiation',
+            'items': ['Platform Launch', 'First MOUs Signed'],
+            'y_offset': 0,
+            'highlight': False
+        },
+        'peak': {
+            'name': 'Peak Engagement',
+            'items': ['Large-scale Medical Missions', 'Physician Training Peak'],
+            'y_offset': 0,
+            'highlight': False
+        },
+        'resilience': {
+            'name': 'Resilience Phase',
+            'items': [
+                'Crisis Response: Zero Service Interruption',
+                'Tech: 5G Smart Glasses Deployed',
+                'Nursing: Nursing Directors On-site',
+                'Admin: 100% Medical Visa Success'
+            ],
+            'y_offset': 1.5,
+            'highlight': True
+        },
+        'scalability': {
+            'name': 'Scalability',
+            'items': [
+                'Vietnam Expansion: MOU with Sakura',
+                'Complex Cases: Neurosurgery/IVF Referrals'
+            ],
+            'y_offset': 0,
+            'highlight': False
+        },
+        'institutionalization': {
+            'name': 'Institutionalization',
+            'items': [
+                'Launch: "Weekly Tele-consultation"',
+                'From "Ad-hoc" to "Routine"'
+            ],
+            'y_offset': 2,
+            'highlight': True
+        }
+    }
+
+    # Draw milestones
+    for phase_id, label, x_pos, color in zip(phases['id'].tolist(), labels,
+                                             phases['x'].tolist(), phases['color'].tolist()):
+        data = milestone_data[phase_id]
+        y_base = timeline_y + data['y_offset']
+
+        # Draw connector line from timeline to box
+        ax.plot([x_pos, x_pos], [timeline_y, y_base + 0.5], 
+                color=color, linewidth=2.5, zorder=2)
+
+        # Draw circle marker on timeline
+        circle = Circle((x_pos, timeline_y), 0.15, 
+                           color=color, ec='white', linewidth=2, zorder=3)
+        ax.add_patch(circle)
+
+        # Create box for milestone content
+        box_width = 1.6
+        box_height = 0.8 + len(data['items']) * 0.25
+
+        if data['highlight']:
+            # Highlighted box with thicker border
+            box = FancyBboxPatch((x_pos - box_width/2, y_base + 0.5), 
+                                box_width, box_height,
+                                boxstyle="round,pad=0.1",
+                                facecolor=color, edgecolor='#000000',
+                                linewidth=4, alpha=0.9, zorder=4)
+            # Add "HIGHLIGHT" label
+            ax.text(x_pos, y_base + box_height + 0.8, '★ HIGHLIGHT ★',
+                   ha='center', va='center', fontsize=9, weight='bold',
+                   color=color,
+                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
+                            edgecolor=color, linewidth=2))
+        else:
+            box = FancyBboxPatch((x_pos - box_width/2, y_base + 0.5), 
+                                box_width, box_height,
+                                boxstyle="round,pad=0.1",
+                                facecolor=color, edgecolor='white',
+                                linewidth=2, alpha=0.85, zorder=4)
+
+        ax.add_patch(box)
+
+        # Add title
+        ax.text(x_pos, y_base + box_height + 0.2, f"{label}\n{data['name']}",
+               ha='center', va='top', fontsize=11, weight='bold',
+               color='white', zorder=5)
+
+        # Add items
+        y_text = y_base + box_height - 0.3
+        for item in data['items']:
+            ax.text(x_pos, y_text, f'• {item}',
+                   ha='center', va='top', fontsize=7.5,
+                   color='white', zorder=5)
+            y_text -= 0.25
+
+    # Add title (moved up with more spacing)
+    title_box = FancyBboxPatch((0.5, 10), 10, 0.7,
+                              boxstyle="round,pad=0.15",
+                              facecolor='#2E86AB', edgecolor='#1565C0',
+                              linewidth=3, alpha=0.9, zorder=10)
+    ax.add_patch(title_box)
+    span = f"{phases['start'][0]}-{phases['end'][-1]}"
+    ax.text(5.5, 10.35, f'Figure 2: The Timeline of Resilience & Expansion ({span})',
+           ha='center', va='center', fontsize=16, weight='bold',
+           color='white', zorder=11)
+
+    # Add timeline arrows at both ends
+    ax.annotate('', xy=(10.3, timeline_y), xytext=(10, timeline_y),
+               arrowprops=dict(arrowstyle='->', lw=3, color='black'))
+
+    # Add legend for phases (moved down)
+    legend_y = 0.8
+    ax.text(5.5, legend_y, 'Evolution: Initiation → Peak → Resilience → Scalability → Institutionalization',
+           ha='center', va='center', fontsize=10, style='italic',
+           color='#555555',
+           bbox=dict(boxstyle='round,pad=0.5', facecolor='#F0F0F0',
+                    edgecolor='#CCCCCC', linewidth=2))
+
+    fig.tight_layout()
@@ -0,0 +1,194 @@
+# Figure 3 (small multiples): one dual-axis panel per MOU partner hospital
+#
+# Render with `python -m figtab fig3_partners --data partners.csv`.
+# NumPy and Matplotlib are imported inside the functions so importing this
+# module stays cheap.
+#
+# Input is a long-format CSV, one row per partner and year:
+#     partner,year,referrals,physicians,nurses_others
+# Missing partner/year rows count as zero. `partners.csv` in the repo root is
+# a small sample in this format.
+#
+# Unlike fig3.py, the left-axis line is cumulative patient referrals, not
+# cumulative MOU hospitals: per partner the MOU count would only ever step
+# from 0 to 1, so the CSV carries a `referrals` column for the line instead.
+# The right axis is the same stacked trainee bars as fig3.py.
+
+OUTPUT = "Figure3_Partner_Small_Multiples.png"
+FIGSIZE = None  # sized from the partner count in draw()
+
+# =========================
+# Style settings (same palette as fig3.py)
+# =========================
+LINE_COLOR = "#C1121F"        # Referral line
+PHYS_COLOR = "#4361EE"        # Physicians
+NONPHYS_COLOR = "#F9844A"     # Nurses/Others
+EDGE_COLOR = "white"
+
+BAR_W = 0.65
+
+# Identical styling is defined once and shared by every panel
+BAR_STYLE = dict(alpha=0.85, edgecolors=EDGE_COLOR, linewidths=1.0, zorder=2)
+LINE_STYLE = dict(
+    color=LINE_COLOR, marker="o", linewidth=2, markersize=4,
+    markeredgecolor="white", markeredgewidth=1, zorder=4
+)
+
+
+def load(csv_path):
+    """Pivot the long-format CSV into (partner, year) arrays in one pass.
+
+    Rows are read with :mod:`csv`, so quoted partner names may contain commas.
+    """
+    import csv
+
+    import numpy as np
+
+    columns = ("referrals", "physicians", "nurses_others")
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        rows = [{k.strip(): v.strip() for k, v in row.items()} for row in csv.DictReader(fh)]
+
+    partners, p_idx = np.unique([row["partner"] for row in rows], return_inverse=True)
+    year = np.array([int(row["year"]) for row in rows])
+    years = np.arange(year.min(), year.max() + 1)
+    y_idx = year - years[0]
+
+    shape = (len(partners), len(years))
+    data = {"partners": partners, "years": years}
+    for column in columns:
+        data[column] = np.zeros(shape)
+        np.add.at(data[column], (p_idx, y_idx), [float(row[column]) for row in rows])
+    return data
+
+
+def _bar_vertices(years, bottom, top):
+    """Bar corners for all panels at once: (partner, year, corner, xy)."""
+    import numpy as np
+
+    x0 = np.broadcast_to(years - BAR_W / 2, bottom.shape)
+    x1 = x0 + BAR_W
+    return np.stack([
+        np.stack([x0, bottom], axis=-1),
+        np.stack([x0, top], axis=-1),
+        np.stack([x1, top], axis=-1),
+        np.stack([x1, bottom], axis=-1),
+    ], axis=2)
+
+
+def draw(fig, data):
+    """Draw one panel per partner onto the empty figure ``fig``.
+
+    ``data`` is a CSV path or the dict returned by :func:`load`.
+    """
+    import numpy as np
+    from matplotlib.collections import PolyCollection
+    from matplotlib.patches import Patch
+    from matplotlib.lines import Line2D
+
+    if not isinstance(data, dict):
+        data = load(data)
+
+    partners, years = data["partners"], data["years"]
+    physicians, nurses_others = data["physicians"], data["nurses_others"]
+    n_partners = len(partners)
+
+    # Left axis (line): cumulative referrals per partner
+    referrals_cum = np.cumsum(data["referrals"], axis=1)
+    total_trainees = physicians + nurses_others
+
+    phys_verts = _bar_vertices(years, np.zeros_like(physicians), physicians)
+    non_verts = _bar_vertices(years, physicians, total_trainees)
+
+    # =========================
+    # Canvas: one shared grid
+    # =========================
+    ncols = int(np.ceil(np.sqrt(n_partners)))
+    nrows = int(np.ceil(n_partners / ncols))
+
+    fig.set_size_inches(3.2 * ncols, 2.6 * nrows + 1.2)
+    axes = fig.subplots(nrows, ncols, sharex=True, sharey=True, squeeze=False)
+    axes = axes.ravel()
+
+    # Right axes share one y-axis (limits + locator) across panels
+    twins = []
+    for ax in axes[:n_partners]:
+        ax2 = ax.twinx()
+        if twins:
+            ax2.sharey(twins[0])
+        twins.append(ax2)
+
+    for i in range(n_partners):
+        ax1, ax2 = axes[i], twins[i]
+
+        # One collection per series instead of one Rectangle per bar
+        ax2.add_collection(PolyCollection(phys_verts[i], facecolors=PHYS_COLOR, **BAR_STYLE))
+        ax2.add_collection(PolyCollection(non_verts[i], facecolors=NONPHYS_COLOR, **BAR_STYLE))
+
+        ax1.plot(years, referrals_cum[i], **LINE_STYLE)
+        ax1.set_zorder(ax2.get_zorder() + 1)
+        ax1.patch.set_visible(False)
+
+        ax1.set_title(partners[i], fontsize=9, weight="bold")
+        ax1.grid(True, axis="y", linestyle="--", alpha=0.25, zorder=0)
+
+        # Inner panels keep ticks but drop duplicated tick labels
+        ax1.label_outer()
+        if i + ncols >= n_partners:
+            ax1.tick_params(axis="x", labelbottom=True)
+        if i % ncols == ncols - 1 or i == n_partners - 1:
+            ax2.set_ylabel("Trainees (stacked)", fontsize=8, weight="bold")
+        else:
+            ax2.tick_params(axis="y", labelright=False)
+
+    for ax in axes[n_partners:]:
+        ax.axis("off")
+
+    # =========================
+    # Shared axis formatting (applied once through the shared axes)
+    # =========================
+    axes[0].set_xticks(years)
+    axes[0].set_xlim(years[0] - 0.6, years[-1] + 0.6)
+    axes[0].set_ylim(0, max(referrals_cum.max() * 1.15, 5))
+    twins[0].set_ylim(0, total_trainees.max() + 2)
+
+    for ax in axes[:n_partners]:
+        ax.tick_params(axis="x", labelrotation=45, labelsize=7)
+        ax.tick_params(axis="y", labelcolor=LINE_COLOR, labelsize=7)
+    for ax2 in twins:
+        ax2.tick_params(axis="y", labelsize=7)
+
+    # =========================
+    # Legend + titles (one set of artists for the whole canvas)
+    # =========================
+    legend_handles = [
+        Line2D(
+            [0], [0],
+            color=LINE_COLOR, linewidth=2,
+            marker="o", markersize=5,
+            markeredgecolor="white", markeredgewidth=1,
+            label="Patient Referrals (cumulative)"
+        ),
+        Patch(
+            facecolor=PHYS_COLOR, edgecolor=EDGE_COLOR, linewidth=1.0,
+            label="Physicians"
+        ),
+        Patch(
+            facecolor=NONPHYS_COLOR, edgecolor=EDGE_COLOR, linewidth=1.0,
+            label="Nurses / Others"
+        ),
+    ]
+
+    fig.legend(
+        handles=legend_handles,
+        loc="lower center", ncol=3,
+        frameon=True, fontsize=10
+    )
+
+    fig.suptitle(
+        "Figure 3: Capacity Building per MOU Partner Hospital\n"
+        f"Dual-Axis Small Multiples ({years[0]}-{years[-1]})",
+        fontsize=15, weight="bold"
+    )
+    fig.supylabel("Referrals (cumulative)", fontsize=11, weight="bold", color=LINE_COLOR)
+
+    fig.tight_layout(rect=(0, 0.05, 1, 1))
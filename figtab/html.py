@@ -0,0 +1,393 @@
+"""Interactive HTML/canvas export of a drawn diagram (used for Figure 1).
+
+:func:`scene` walks the laid-out figure and turns every patch, text bbox,
+arrow and text into data-coordinate primitives, so the page shows exactly
+the layout Matplotlib produced. The page is self-contained (no server, no
+libraries) and stays smooth with thousands of nodes:
+
+* a uniform grid index over item bounds drives viewport culling and
+  hover hit-testing;
+* aggregate nodes, i.e. artists with the gid ``aggregate:<name>``, take
+  their child count from the dataset table "counts" and expand into
+  individual child nodes once a child would be at least ``LOD_PX`` pixels
+  on screen, collapsing again when zoomed out;
+* text smaller than a few pixels is skipped, and frames are only drawn
+  when the view changes.
+"""
+
+import json
+import re
+
+# Zoom level (on-screen px per child cell) at which aggregates expand
+LOD_PX = 14
+
+# gid prefix marking an aggregate; the rest is its counts.name
+AGGREGATE_GID = "aggregate:"
+
+
+def _rgba(color):
+    if color is None:
+        return None
+    r, g, b, a = color
+    return f"rgba({r * 255:.0f},{g * 255:.0f},{b * 255:.0f},{a:.3g})"
+
+
+def _round(values):
+    return [round(float(v), 3) for v in values]
+
+
+def scene(fig):
+    """Return the JSON-ready scene of ``fig``'s single axes, in draw order."""
+    from matplotlib.colors import to_rgba
+    from matplotlib.patches import FancyBboxPatch
+    from matplotlib.text import Text
+
+    from figtab import dataset
+    from figtab.vector import shapes_for
+
+    counts = dataset.load()["counts"].lookup("name", "value")
+
+    fig.draw_without_rendering()
+    renderer = fig._get_renderer()
+    ax = fig.axes[0]
+    to_data = ax.transData.inverted()
+    px_per_unit = ax.transData.transform((1, 0))[0] - ax.transData.transform((0, 0))[0]
+    point = renderer.points_to_pixels(1) / px_per_unit   # one point in data units
+
+    items, boxes, texts = [], [], []
+    children = sorted(enumerate(ax._children), key=lambda ia: (ia[1].get_zorder(), ia[0]))
+    for _, artist in children:
+        if not artist.get_visible():
+            continue
+        for shape in shapes_for(artist, renderer):
+            rings = [to_data.transform(r) for r in
+                     shape.display_path.to_polygons(closed_only=False)]
+            if not rings:
+                continue
+            style = shape.style
+            item = {
+                "k": "poly",
+                "rings": [_round(r.ravel()) for r in rings],
+                "fill": _rgba(style["facecolor"]),
+                "stroke": _rgba(style["edgecolor"]),
+                "lw": round(style["linewidth"] * point, 4),
+                "dash": style["linestyle"] in ("--", "dashed"),
+                "bb": _round(to_data.transform(shape.extent).ravel()),
+            }
+            gid = shape.source.get_gid() or ""
+            if gid.startswith(AGGREGATE_GID):
+                name = gid[len(AGGREGATE_GID):]
+                item["agg"] = {"n": counts[name], "name": name,
+                               "fill": item["fill"], "stroke": "rgba(255,255,255,1)"}
+            if isinstance(shape.source, Text) or type(shape.source) is FancyBboxPatch:
+                boxes.append(len(items))
+            items.append(item)
+
+        if type(artist) is Text and artist.get_text() and artist.get_transform() == ax.transData:
+            x, y = artist.get_position()
+            extent = to_data.transform(artist.get_window_extent(renderer)).ravel()
+            item = {
+                "k": "text",
+                "text": artist.get_text(),
+                "x": round(x, 3), "y": round(y, 3),
+                "size": round(artist.get_fontsize() * point, 4),
+                "color": _rgba(to_rgba(artist.get_color())),
+                "weight": str(artist.get_fontweight()),
+                "style": artist.get_fontstyle(),
+                "rot": artist.get_rotation(),
+                "ha": artist.get_horizontalalignment(),
+                "va": artist.get_verticalalignment(),
+                "bb": _round(extent),
+            }
+            texts.append(item)
+            items.append(item)
+
+    # Box labels, and aggregates that expand on zoom
+    for text in texts:
+        for index in reversed(boxes):   # topmost box first
+            box = items[index]
+            x0, y0, x1, y1 = box["bb"]
+            if not (x0 <= text["x"] <= x1 and y0 <= text["y"] <= y1):
+                continue
+            box["label"] = " ".join(text["text"].split())
+            if "agg" in box:
+                # Children are named after the label without its count
+                n = box["agg"]["n"]
+                name = re.sub(rf"\(x{n}\)|^{n}\b", "", box["label"])
+                box["agg"]["name"] = " ".join(name.split())
+                text["hideIf"] = index
+            break
+
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    return {"bounds": [x0, x1, y0, y1], "items": items}
+
+
+def save_html(fig, out, title="figtab"):
+    """Write ``fig`` as a self-contained interactive HTML page."""
+    data = json.dumps(scene(fig), separators=(",", ":"))
+    page = (_TEMPLATE
+            .replace("__TITLE__", title)
+            .replace("__LOD_PX__", str(LOD_PX))
+            .replace("__SCENE__", data.replace("</", "<\\/")))
+    with open(out, "w", encoding="utf-8") as fh:
+        fh.write(page)
+
+
+_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>__TITLE__</title>
+<style>
+html, body { margin: 0; height: 100%; overflow: hidden; background: #fff; font-family: sans-serif; }
+canvas { display: block; width: 100vw; height: 100vh; cursor: grab; touch-action: none; }
+canvas.dragging { cursor: grabbing; }
+#tip { position: fixed; pointer-events: none; display: none; padding: 4px 8px; border-radius: 4px;
+       background: rgba(0, 0, 0, 0.8); color: #fff; font-size: 12px; white-space: pre; }
+#help { position: fixed; left: 8px; bottom: 8px; font-size: 11px; color: #666; }
+</style>
+</head>
+<body>
+<canvas id="canvas"></canvas>
+<div id="tip"></div>
+<div id="help">drag: pan &middot; wheel: zoom &middot; double-click: reset &middot; <span id="stats"></span></div>
+<script>
+"use strict";
+const SCENE = __SCENE__;
+const LOD_PX = __LOD_PX__;   // expand an aggregate once a child cell is this many px
+const MIN_TEXT_PX = 3;       // skip text smaller than this on screen
+const CELLS = 64;            // spatial grid resolution per axis
+
+const canvas = document.getElementById("canvas");
+const ctx = canvas.getContext("2d");
+const tip = document.getElementById("tip");
+const stats = document.getElementById("stats");
+const items = SCENE.items;
+const [BX0, BX1, BY0, BY1] = SCENE.bounds;
+
+// ---- Aggregates: child nodes laid out in a grid inside the parent box ----
+const baseCount = items.length;
+for (let i = 0; i < baseCount; i++) {
+  const it = items[i];
+  it.order = i;
+  if (!it.agg) continue;
+  const [x0, y0, x1, y1] = it.bb;
+  const w = x1 - x0, h = y1 - y0, n = it.agg.n;
+  const cols = Math.max(1, Math.round(Math.sqrt(n * w / h)));
+  const rows = Math.ceil(n / cols);
+  const cw = w / cols, ch = h / rows;
+  it.cell = Math.min(cw, ch);
+  for (let k = 0; k < n; k++) {
+    const cx = x0 + (k % cols) * cw, cy = y1 - (Math.floor(k / cols) + 1) * ch;
+    items.push({k: "child", parent: i, order: i + (k + 1) / (n + 1),
+                bb: [cx, cy, cx + cw, cy + ch], label: it.agg.name + " #" + (k + 1),
+                fill: it.agg.fill, stroke: it.agg.stroke});
+  }
+}
+
+// ---- Spatial index: uniform grid over item bounds ----
+const GW = (BX1 - BX0) / CELLS, GH = (BY1 - BY0) / CELLS;
+const grid = Array.from({length: CELLS * CELLS}, () => []);
+const clampCell = v => Math.min(CELLS - 1, Math.max(0, Math.floor(v)));
+function cellRange(bb) {
+  return [clampCell((bb[0] - BX0) / GW), clampCell((bb[1] - BY0) / GH),
+          clampCell((bb[2] - BX0) / GW), clampCell((bb[3] - BY0) / GH)];
+}
+items.forEach((it, idx) => {
+  const [i0, j0, i1, j1] = cellRange(it.bb);
+  for (let j = j0; j <= j1; j++)
+    for (let i = i0; i <= i1; i++) grid[j * CELLS + i].push(idx);
+});
+
+const seen = new Uint32Array(items.length);
+let stamp = 0;
+function query(bb) {
+  const out = [];
+  const [i0, j0, i1, j1] = cellRange(bb);
+  stamp++;
+  for (let j = j0; j <= j1; j++) {
+    for (let i = i0; i <= i1; i++) {
+      for (const idx of grid[j * CELLS + i]) {
+        if (seen[idx] === stamp) continue;
+        seen[idx] = stamp;
+        const b = items[idx].bb;
+        if (b[0] <= bb[2] && b[2] >= bb[0] && b[1] <= bb[3] && b[3] >= bb[1]) out.push(idx);
+      }
+    }
+  }
+  return out;
+}
+
+// ---- View: data -> screen ----
+let W = 0, H = 0, dpr = 1, cx = 0, cy = 0, scale = 1;
+const sx = x => (x - cx) * scale + W / 2;
+const sy = y => H / 2 - (y - cy) * scale;
+const dataX = px => (px - W / 2) / scale + cx;
+const dataY = py => cy - (py - H / 2) / scale;
+const expanded = it => it.cell * scale >= LOD_PX;
+
+function reset() {
+  cx = (BX0 + BX1) / 2;
+  cy = (BY0 + BY1) / 2;
+  scale = Math.min(W / (BX1 - BX0), H / (BY1 - BY0));
+  invalidate();
+}
+
+function resize() {
+  dpr = window.devicePixelRatio || 1;
+  W = canvas.clientWidth;
+  H = canvas.clientHeight;
+  canvas.width = Math.round(W * dpr);
+  canvas.height = Math.round(H * dpr);
+  invalidate();
+}
+
+// ---- Drawing ----
+function strokeAndFill(it) {
+  if (it.fill) { ctx.fillStyle = it.fill; ctx.fill(); }
+  if (it.stroke && it.lw) {
+    const lw = Math.max(it.lw * scale, 0.5);
+    ctx.lineWidth = lw;
+    ctx.setLineDash(it.dash ? [3.7 * lw, 1.6 * lw] : []);
+    ctx.strokeStyle = it.stroke;
+    ctx.stroke();
+  }
+}
+
+function drawPoly(it) {
+  ctx.beginPath();
+  for (const ring of it.rings) {
+    ctx.moveTo(sx(ring[0]), sy(ring[1]));
+    for (let k = 2; k < ring.length; k += 2) ctx.lineTo(sx(ring[k]), sy(ring[k + 1]));
+    const n = ring.length;
+    if (ring[0] === ring[n - 2] && ring[1] === ring[n - 1]) ctx.closePath();
+  }
+  strokeAndFill(it);
+}
+
+function drawText(it) {
+  const size = it.size * scale;
+  if (size < MIN_TEXT_PX) return;
+  if (it.hideIf !== undefined && expanded(items[it.hideIf])) return;
+  const lines = it.text.split("\\n");
+  const lh = 1.2 * size;
+  const top = it.va === "top" ? lh / 2
+            : it.va === "center" || it.va === "center_baseline" ? -(lines.length - 1) * lh / 2
+            : -(lines.length - 1) * lh - lh / 2;
+  ctx.save();
+  ctx.translate(sx(it.x), sy(it.y));
+  ctx.rotate(-it.rot * Math.PI / 180);
+  ctx.font = `${it.style} ${it.weight} ${size}px "DejaVu Sans", sans-serif`;
+  ctx.textAlign = it.ha;
+  ctx.textBaseline = "middle";
+  ctx.fillStyle = it.color;
+  lines.forEach((line, k) => ctx.fillText(line, 0, top + k * lh));
+  ctx.restore();
+}
+
+function drawChild(it) {
+  if (!expanded(items[it.parent])) return;
+  const [x0, y0, x1, y1] = it.bb;
+  const inset = 0.08 * (x1 - x0);
+  const w = (x1 - x0 - 2 * inset) * scale, h = (y1 - y0 - 2 * inset) * scale;
+  ctx.beginPath();
+  ctx.rect(sx(x0 + inset), sy(y1 - inset), w, h);
+  ctx.setLineDash([]);
+  ctx.fillStyle = it.fill || "#ccc";
+  ctx.fill();
+  ctx.lineWidth = 1;
+  ctx.strokeStyle = it.stroke;
+  ctx.stroke();
+  if (w > 48) {
+    ctx.fillStyle = "#111";
+    ctx.font = `${Math.min(h / 4, 12)}px sans-serif`;
+    ctx.textAlign = "center";
+    ctx.textBaseline = "middle";
+    ctx.fillText(it.label, sx((x0 + x1) / 2), sy((y0 + y1) / 2), w - 4);
+  }
+}
+
+function draw() {
+  ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+  ctx.fillStyle = "#fff";
+  ctx.fillRect(0, 0, W, H);
+  ctx.lineJoin = "round";
+
+  // Viewport culling through the grid, then back to draw order
+  const visible = query([dataX(0), dataY(H), dataX(W), dataY(0)]);
+  visible.sort((a, b) => items[a].order - items[b].order);
+  for (const idx of visible) {
+    const it = items[idx];
+    if (it.k === "poly") drawPoly(it);
+    else if (it.k === "text") drawText(it);
+    else drawChild(it);
+  }
+  stats.textContent = `${visible.length} / ${items.length} items in view`;
+}
+
+let pending = false;
+function invalidate() {
+  if (pending) return;
+  pending = true;
+  requestAnimationFrame(() => { pending = false; draw(); });
+}
+
+// ---- Hit-testing (hover) through the same grid ----
+function hit(px, py) {
+  const x = dataX(px), y = dataY(py);
+  let best = null;
+  for (const idx of query([x, y, x, y])) {
+    const it = items[idx];
+    if (!it.label) continue;
+    if (it.k === "child" && !expanded(items[it.parent])) continue;
+    if (!best || it.order > best.order) best = it;
+  }
+  return best;
+}
+
+// ---- Interaction ----
+let drag = null;
+canvas.addEventListener("pointerdown", e => {
+  drag = {x: e.clientX, y: e.clientY};
+  canvas.setPointerCapture(e.pointerId);
+  canvas.classList.add("dragging");
+});
+canvas.addEventListener("pointermove", e => {
+  if (drag) {
+    cx -= (e.clientX - drag.x) / scale;
+    cy += (e.clientY - drag.y) / scale;
+    drag = {x: e.clientX, y: e.clientY};
+    tip.style.display = "none";
+    invalidate();
+    return;
+  }
+  const it = hit(e.clientX, e.clientY);
+  if (it) {
+    tip.textContent = it.agg ? `${it.label}\\n(zoom in to expand ${it.agg.n})` : it.label;
+    tip.style.left = e.clientX + 12 + "px";
+    tip.style.top = e.clientY + 12 + "px";
+    tip.style.display = "block";
+  } else {
+    tip.style.display = "none";
+  }
+});
+canvas.addEventListener("pointerup", () => { drag = null; canvas.classList.remove("dragging"); });
+canvas.addEventListener("wheel", e => {
+  e.preventDefault();
+  const x = dataX(e.offsetX), y = dataY(e.offsetY);
+  scale *= Math.exp(-e.deltaY * 0.0015);
+  cx = x - (e.offsetX - W / 2) / scale;
+  cy = y + (e.offsetY - H / 2) / scale;
+  invalidate();
+}, {passive: false});
+canvas.addEventListener("dblclick", reset);
+window.addEventListener("resize", resize);
+
+resize();
+reset();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,184 @@
+"""Reusable figure/canvas pool for long-running batch rendering.
+
+Each render through pyplot registers a new figure with the pyplot manager
+and allocates a fresh Agg canvas and renderer. :class:`CanvasPool` instead
+keeps a bounded set of bare Agg-backed figures keyed by ``(figsize, dpi)``
+and clears their artists between renders, and pyplot never sees them.
+
+A pooled figure is created at its key's dpi, so layout (``tight_layout``)
+and the final draw share the canvas's one cached Agg renderer. PNGs are then
+cropped out of that renderer's buffer (:func:`save_png_tight`) instead of
+letting ``savefig(bbox_inches="tight")`` allocate a second, cropped canvas,
+so after its first render a pooled figure allocates no new Agg buffers.
+"""
+
+import gc
+import io
+import sys
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from figtab.render import SAVE_KW, load_figure, save
+
+# Most idle figures kept across all keys
+MAX_IDLE = 8
+
+# Default resolution for leak checks: small buffers, same artists
+LEAK_DPI = 50
+
+# Allowed growth over --leak-check renders, after warm-up
+LEAK_BUDGET_MB = 20
+LEAK_BUDGET_OBJECTS = 1000
+
+
+class CanvasPool:
+    """Bounded pool of Agg-backed figures keyed by ``(figsize, dpi)``.
+
+    ``dpi`` is the resolution the figure will be saved at and is also set
+    as the figure's dpi, so layout and saving use the same renderer.
+    """
+
+    def __init__(self, max_idle=MAX_IDLE):
+        self.max_idle = max_idle
+        self._idle = OrderedDict()   # key -> [Figure], least recently used first
+        self._keys = {}              # id(fig) -> key, for checked-out figures
+
+    def __len__(self):
+        return sum(len(figs) for figs in self._idle.values())
+
+    def acquire(self, figsize=None, dpi=300):
+        """Return an empty figure for ``figsize``, reusing an idle one if possible."""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        key = (tuple(figsize) if figsize else None, dpi)
+        idle = self._idle.get(key)
+        if idle:
+            fig = idle.pop()
+            self._idle.move_to_end(key)
+        else:
+            fig = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(fig)
+        self._keys[id(fig)] = key
+        return fig
+
+    def release(self, fig):
+        """Clear ``fig`` and return it to the pool (or drop it if the pool is full)."""
+        import matplotlib
+
+        key = self._keys.pop(id(fig))
+        fig.clear()
+        # draw() may resize the figure or adjust margins; undo both
+        fig.set_size_inches(key[0] or matplotlib.rcParams["figure.figsize"])
+        fig.subplotpars.update(**{
+            k: matplotlib.rcParams[f"figure.subplot.{k}"]
+            for k in ("left", "right", "bottom", "top", "wspace", "hspace")
+        })
+
+        if len(self) >= self.max_idle:
+            if not self._idle:
+                return
+            oldest = next(iter(self._idle))
+            self._idle[oldest].pop(0)
+            if not self._idle[oldest]:
+                del self._idle[oldest]
+        self._idle.setdefault(key, []).append(fig)
+        self._idle.move_to_end(key)
+
+    @contextmanager
+    def figure(self, figsize=None, dpi=300):
+        fig = self.acquire(figsize, dpi)
+        try:
+            yield fig
+        finally:
+            self.release(fig)
+
+    def render(self, name, out, dpi=300, fmt="png", lean=False, tolerance=None,
+               text_to_path=False, **options):
+        """Draw figure ``name`` on a pooled canvas and save it to ``out``.
+
+        ``out`` may be a path or (for raster formats) a binary file object.
+        Saving options are those of :func:`figtab.render.save`; ``options``
+        go to the module's ``draw()``.
+        """
+        module = load_figure(name)
+        with self.figure(module.FIGSIZE, dpi) as fig:
+            module.draw(fig, **options)
+            if fmt == "png" and not lean:
+                save_png_tight(fig, out)
+            else:
+                save(fig, out, fmt, dpi, lean, tolerance, text_to_path)
+        return out
+
+
+def save_png_tight(fig, out):
+    """Save ``fig`` like ``savefig(bbox_inches="tight")``, reusing its renderer.
+
+    Draws the full figure at ``fig.dpi`` on the canvas's cached renderer
+    and crops the tight bbox out of its buffer. Falls back to
+    :func:`figtab.render.save` when the tight bbox reaches outside the
+    figure, which only a separate canvas can hold.
+    """
+    import matplotlib
+    import numpy as np
+    from matplotlib.image import imsave
+
+    dpi = fig.dpi
+    facecolor, edgecolor = fig.get_facecolor(), fig.get_edgecolor()
+    fig.set_facecolor(SAVE_KW["facecolor"])
+    fig.set_edgecolor(SAVE_KW["edgecolor"])
+    try:
+        fig.canvas.draw()
+        renderer = fig.canvas.get_renderer()
+        bbox = fig.get_tightbbox(renderer).padded(matplotlib.rcParams["savefig.pad_inches"])
+        width, height = fig.get_size_inches()
+        if bbox.x0 < 0 or bbox.y0 < 0 or bbox.x1 > width or bbox.y1 > height:
+            save(fig, out, "png", dpi)
+            return
+
+        # Same size as savefig's cropped canvas; the origin snaps to the
+        # nearest pixel instead of shifting the drawing by a fraction of one
+        pixels = np.asarray(renderer.buffer_rgba())
+        rows, cols = pixels.shape[:2]
+        # Truncated with the same tolerance as FigureCanvasBase.get_width_height
+        width, height = int(bbox.width * dpi + 1e-8), int(bbox.height * dpi + 1e-8)
+        left = min(round(bbox.x0 * dpi), cols - width)
+        bottom = min(round(bbox.y0 * dpi), rows - height)
+        crop = pixels[rows - bottom - height:rows - bottom, left:left + width]
+        imsave(out, crop, format="png", dpi=dpi)
+    finally:
+        fig.set_facecolor(facecolor)
+        fig.set_edgecolor(edgecolor)
+
+
+def _peak_rss_mb():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def leak_check(name, renders=1000, dpi=LEAK_DPI, fmt="png", warmup=20, report=None, **options):
+    """Render ``name`` repeatedly through one pool and measure growth.
+
+    Returns ``(rss_growth_mb, object_growth)`` measured after ``warmup``
+    renders; both should stay near zero however large ``renders`` is.
+    """
+    pool = CanvasPool()
+
+    def once():
+        pool.render(name, io.BytesIO(), dpi=dpi, fmt=fmt, **options)
+
+    for _ in range(warmup):
+        once()
+    gc.collect()
+    rss0, objects0 = _peak_rss_mb(), len(gc.get_objects())
+
+    for i in range(1, renders + 1):
+        once()
+        if report and i % max(renders // 10, 1) == 0:
+            report(i, _peak_rss_mb() - rss0)
+
+    gc.collect()
+    return _peak_rss_mb() - rss0, len(gc.get_objects()) - objects0
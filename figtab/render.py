@@ -0,0 +1,87 @@
+"""Shared render path: backend selection and lazy figure loading."""
+
+import importlib
+import os
+import sys
+
+SAVE_KW = dict(bbox_inches="tight", facecolor="white", edgecolor="none")
+
+
+def use_headless_backend():
+    """Force the non-interactive Agg backend when no display is available.
+
+    Must run before Matplotlib is imported. An explicit ``MPLBACKEND`` always
+    wins. Returns True when Agg was forced.
+    """
+    if "MPLBACKEND" in os.environ:
+        return False
+    if sys.platform in ("darwin", "win32"):
+        return False
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"):
+        return False
+    os.environ["MPLBACKEND"] = "Agg"
+    return True
+
+
+def load_figure(name):
+    """Import ``figtab.<name>``; the module itself imports nothing heavy."""
+    return importlib.import_module(f"figtab.{name}")
+
+
+def output_path(name, fmt="png", out_dir="."):
+    """Default output path for figure ``name`` saved as ``fmt``."""
+    stem = os.path.splitext(load_figure(name).OUTPUT)[0]
+    return os.path.join(out_dir, f"{stem}.{fmt}")
+
+
+def build_figure(name, **options):
+    """Create a bare (non-pyplot) Figure and draw figure ``name`` onto it."""
+    from matplotlib.figure import Figure
+
+    module = load_figure(name)
+    fig = Figure(figsize=module.FIGSIZE)
+    module.draw(fig, **options)
+    return fig
+
+
+def save(fig, out, fmt="png", dpi=300, lean=False, tolerance=None, text_to_path=False):
+    """Save a drawn figure; ``lean`` goes through :func:`figtab.vector.save_lean`.
+
+    ``fmt="html"`` writes an interactive page via :func:`figtab.html.save_html`.
+    """
+    if fmt == "html":
+        from figtab import html
+        html.save_html(fig, out)
+    elif lean:
+        from figtab import vector
+        vector.save_lean(fig, out, fmt, vector.TOLERANCE if tolerance is None else tolerance,
+                         text_to_path, dpi=dpi, **SAVE_KW)
+    else:
+        fig.savefig(out, format=fmt, dpi=dpi, **SAVE_KW)
+
+
+def render(name, out=None, dpi=300, show=False, fmt="png", lean=False,
+           tolerance=None, text_to_path=False, **options):
+    """Draw figure ``name`` and save it to ``out`` (default: its OUTPUT).
+
+    ``options`` are passed through to the module's ``draw()``. With
+    ``show=True`` the figure is created through pyplot and displayed;
+    otherwise pyplot (and its GUI backend) is never imported. ``lean``
+    saves through :func:`figtab.vector.save_lean` with the given
+    ``tolerance`` (points) and ``text_to_path`` setting.
+    """
+    if show:
+        import matplotlib.pyplot as plt
+        module = load_figure(name)
+        fig = plt.figure(figsize=module.FIGSIZE)
+        module.draw(fig, **options)
+    else:
+        fig = build_figure(name, **options)
+
+    out = out or output_path(name, fmt)
+    save(fig, out, fmt, dpi, lean, tolerance, text_to_path)
+
+    if show:
+        plt.show()
+        plt.close(fig)
+    return out
@@ -0,0 +1,330 @@
+"""Lean vector export: merge same-styled shapes, simplify paths, share styles.
+
+Matplotlib writes one SVG/PDF element per patch, per text bbox and per arrow
+part, each with its own inline style. :func:`save_lean` freezes the laid-out
+figure, merges shapes that share a style into one compound path, drops
+control points that are within ``tolerance`` of a straight line, and for SVG
+moves repeated inline styles into shared CSS classes.
+
+Merging never changes what is painted: a shape only joins a group if it does
+not overlap anything it would be moved in front of, nor (unless it is opaque
+and only filled or only stroked) the other members.
+"""
+
+import re
+from collections import Counter
+
+# Default simplification tolerance, in points
+TOLERANCE = 0.5
+
+
+def rc_params(fmt, text_to_path=False):
+    """rcParams for a lean export in ``fmt``.
+
+    Without ``text_to_path`` SVG text stays live ``<text>`` and PDF embeds
+    TrueType subsets; with it both formats draw glyphs from shared path
+    definitions.
+    """
+    params = {
+        "path.simplify": True,
+        "svg.hashsalt": "figtab",
+    }
+    if fmt == "svg":
+        params["svg.fonttype"] = "path" if text_to_path else "none"
+    elif fmt == "pdf":
+        params["pdf.fonttype"] = 3 if text_to_path else 42
+    return params
+
+
+def _rdp(points, tol):
+    """Ramer-Douglas-Peucker keep-mask for a polyline of display points."""
+    import numpy as np
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        a, b = points[i], points[j]
+        seg = b - a
+        rel = points[i + 1:j] - a
+        norm = np.hypot(*seg)
+        if norm == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / norm
+        k = int(np.argmax(dist))
+        if dist[k] > tol:
+            keep[i + 1 + k] = True
+            stack += [(i, i + 1 + k), (i + 1 + k, j)]
+    return keep
+
+
+def simplify_path(path, tol):
+    """Return ``path`` (display coords) simplified to ``tol`` pixels.
+
+    Bezier segments whose control points lie within ``tol`` of their chord
+    become straight lines, then straight runs are thinned with
+    Ramer-Douglas-Peucker.
+    """
+    import numpy as np
+    from matplotlib.path import Path
+
+    verts, codes = [], []
+    for seg, code in path.iter_segments(curves=True, simplify=False):
+        seg = np.asarray(seg, dtype=float).reshape(-1, 2)
+        if code in (Path.CURVE3, Path.CURVE4) and verts:
+            start, end = verts[-1], seg[-1]
+            chord = end - start
+            norm = np.hypot(*chord)
+            rel = seg[:-1] - start
+            if norm == 0:
+                dist = np.hypot(rel[:, 0], rel[:, 1])
+            else:
+                dist = np.abs(chord[0] * rel[:, 1] - chord[1] * rel[:, 0]) / norm
+            if dist.max() <= tol:
+                seg, code = seg[-1:], Path.LINETO
+        if code == Path.CLOSEPOLY:
+            seg = seg[-1:]
+        verts.extend(seg)
+        codes.extend([code] * len(seg))
+
+    verts = np.array(verts)
+    codes = np.array(codes, dtype=Path.code_type)
+
+    # Thin every run of consecutive LINETOs (plus the vertex it starts from)
+    keep = np.ones(len(codes), dtype=bool)
+    is_line = codes == Path.LINETO
+    i = 0
+    while i < len(codes):
+        if not is_line[i]:
+            i += 1
+            continue
+        j = i
+        while j < len(codes) and is_line[j]:
+            j += 1
+        if i > 0 and j - i >= 2:
+            keep[i - 1:j] = _rdp(verts[i - 1:j], tol)
+        i = j
+    return Path(verts[keep], codes[keep])
+
+
+class _Shape:
+    """One mergeable part: a patch, a text bbox, or one part of an arrow."""
+
+    def __init__(self, source, style, display_path, zorder, clip_from, renderer):
+        self.source = source
+        self.style = style
+        self.display_path = display_path
+        self.zorder = zorder
+        self.clip_from = clip_from
+        # Include the stroke, which is centred on the path
+        pad = renderer.points_to_pixels(style["linewidth"]) / 2 + 1
+        self.extent = display_path.get_extents().padded(pad)
+
+        # Opaque shapes that only fill or only stroke paint the same whether
+        # drawn one by one or as one compound path, even where they overlap
+        fc, ec = style["facecolor"], style["edgecolor"]
+        self.overlap_ok = ((fc is None) != (ec is None)
+                           and (fc or ec)[3] == 1 and not style["hatch"])
+
+        self.key = (zorder, tuple(sorted((k, str(v)) for k, v in style.items())),
+                    clip_from.get_clip_on(), id(clip_from.get_clip_path()))
+
+
+def _style(patch, fill=True):
+    from matplotlib.colors import to_rgba
+
+    lw = patch.get_linewidth()
+    edge = patch.get_edgecolor()
+    return dict(
+        facecolor=tuple(to_rgba(patch.get_facecolor())) if fill and patch.get_fill() else None,
+        edgecolor=tuple(to_rgba(edge)) if lw and to_rgba(edge)[3] else None,
+        linewidth=lw,
+        linestyle=patch.get_linestyle(),
+        capstyle=patch.get_capstyle(),
+        joinstyle=patch.get_joinstyle(),
+        hatch=patch.get_hatch(),
+    )
+
+
+def shapes_for(artist, renderer):
+    """Mergeable parts of ``artist`` in draw order ([] if it is a blocker)."""
+    from matplotlib.patches import (Circle, Ellipse, FancyArrowPatch, FancyBboxPatch,
+                                    PathPatch, Polygon, Rectangle, Wedge)
+    from matplotlib.text import Text
+
+    if not artist.get_visible():
+        return []
+
+    if isinstance(artist, FancyArrowPatch):
+        # Arrow heads may be filled while the shaft is not; the public
+        # get_path() merges both, so split them the way draw() does.
+        paths, fillable = artist._get_path_in_displaycoord()
+        if not isinstance(paths, (list, tuple)):
+            paths, fillable = [paths], [fillable]
+        return [_Shape(artist, _style(artist, fill=f), p, artist.get_zorder(), artist, renderer)
+                for p, f in zip(paths, fillable)]
+
+    if type(artist) in (Circle, Ellipse, FancyBboxPatch, PathPatch, Polygon, Rectangle, Wedge):
+        path = artist.get_transform().transform_path(artist.get_path())
+        return [_Shape(artist, _style(artist), path, artist.get_zorder(), artist, renderer)]
+
+    if type(artist) is Text and artist.get_bbox_patch() is not None and artist.get_text():
+        bbox = artist.get_bbox_patch()
+        path = bbox.get_transform().transform_path(bbox.get_path())
+        return [_Shape(artist, _style(bbox), path, artist.get_zorder(), artist, renderer)]
+
+    return []
+
+
+def _blocker_extent(artist, renderer):
+    from matplotlib.transforms import Bbox
+
+    try:
+        return artist.get_window_extent(renderer)
+    except Exception:
+        # Unknown extent: treat as covering everything
+        return Bbox([[-float("inf")] * 2, [float("inf")] * 2])
+
+
+def _can_join(members, shape, skipped, renderer):
+    """Whether ``shape`` can move back to its group's slot unchanged on screen."""
+    from matplotlib.text import Text
+
+    if not shape.overlap_ok and any(m.extent.overlaps(shape.extent) for m in members):
+        return False
+    for other, other_shapes in skipped:
+        if other.get_zorder() != shape.zorder:
+            continue
+        extents = [s.extent for s in other_shapes if s not in members]
+        if not other_shapes or isinstance(other, Text):
+            extents.append(_blocker_extent(other, renderer))
+        if any(e.overlaps(shape.extent) for e in extents):
+            return False
+    return True
+
+
+def _group(entries, renderer):
+    """Greedy merge groups over ``entries`` = [(artist, [shapes])] in draw order."""
+    groups = []   # [index of the first member's artist, [shapes]]
+    open_groups = {}
+
+    for i, (artist, shapes) in enumerate(entries):
+        for shape in shapes:
+            group = open_groups.get(shape.key)
+            if group is None or not _can_join(group[1], shape, entries[group[0]:i], renderer):
+                group = [i, []]
+                groups.append(group)
+                open_groups[shape.key] = group
+            group[1].append(shape)
+    return groups
+
+
+def merge_shapes(fig, tolerance=TOLERANCE):
+    """Merge same-styled patches, text bboxes and arrows of every axes in ``fig``.
+
+    ``tolerance`` is in points. Returns the number of artists removed.
+    """
+    from matplotlib.path import Path
+    from matplotlib.patches import FancyArrowPatch, PathPatch
+    from matplotlib.text import Text
+
+    fig.draw_without_rendering()
+    renderer = fig._get_renderer()
+    tol_px = renderer.points_to_pixels(tolerance)
+
+    removed = 0
+    for ax in fig.axes:
+        children = list(ax._children)
+        entries = [(a, shapes_for(a, renderer)) for a in children]
+        groups = _group(entries, renderer)
+
+        replaced = set()
+        inserts = {}
+        for first, shapes in groups:
+            arrows = any(isinstance(s.source, FancyArrowPatch) for s in shapes)
+            if len(shapes) < 2 and not arrows:
+                continue
+            to_data = ax.transData.inverted()
+            path = Path.make_compound_path(*[
+                to_data.transform_path(simplify_path(s.display_path, tol_px))
+                for s in shapes
+            ])
+            style = shapes[0].style
+            merged = PathPatch(
+                path, transform=ax.transData, zorder=shapes[0].zorder,
+                facecolor=style["facecolor"] or "none",
+                edgecolor=style["edgecolor"] or "none",
+                linewidth=style["linewidth"], linestyle=style["linestyle"],
+                capstyle=style["capstyle"], joinstyle=style["joinstyle"],
+                hatch=style["hatch"],
+            )
+            ax.add_artist(merged)
+            # Text bboxes never counted towards bbox_inches="tight"
+            merged.set_in_layout(not isinstance(shapes[0].source, Text))
+            merged.set_clip_on(shapes[0].clip_from.get_clip_on())
+            merged.set_clip_path(shapes[0].clip_from.get_clip_path())
+            inserts.setdefault(first, []).append(merged)
+            replaced.update(id(s.source) for s in shapes)
+
+        # Arrows with a merged part are replaced wholesale, so every part of
+        # such an arrow must have been emitted above
+        new_children = []
+        for i, artist in enumerate(children):
+            new_children += inserts.get(i, [])
+            if id(artist) not in replaced:
+                new_children.append(artist)
+            elif type(artist) is Text:
+                artist.set_bbox(None)
+                new_children.append(artist)
+        removed += len(children) - len(new_children)
+        ax._children[:] = new_children
+    return removed
+
+
+_STYLE_ATTR = re.compile(r' style="([^"]*)"')
+
+
+def dedupe_svg_styles(svg):
+    """Move inline styles used more than once into shared CSS classes."""
+    counts = Counter(_STYLE_ATTR.findall(svg))
+    classes = {s: f"s{i}" for i, s in enumerate(s for s, n in counts.items() if n > 1)}
+    if not classes:
+        return svg
+
+    svg = _STYLE_ATTR.sub(
+        lambda m: f' class="{classes[m[1]]}"' if m[1] in classes else m[0], svg)
+    css = "".join(f"\n.{c}{{{s}}}" for s, c in classes.items())
+    if '<style type="text/css">' in svg:
+        return svg.replace("</style>", css + "\n</style>", 1)
+    return re.sub(r"(<svg[^>]*>)", rf'\1\n<defs><style type="text/css">{css}\n</style></defs>',
+                  svg, count=1)
+
+
+def save_lean(fig, out, fmt, tolerance=TOLERANCE, text_to_path=False, **save_kw):
+    """Merge and simplify ``fig``, then save it to ``out`` as ``fmt``."""
+    import matplotlib
+
+    # Merged paths are frozen in data coordinates, and text extents do not
+    # scale exactly with dpi, so merge at the dpi the output is drawn at
+    # (vector backends always lay out at 72)
+    vector = fmt in ("svg", "pdf")
+    original_dpi = fig.dpi
+    fig.set_dpi(72 if vector else save_kw.get("dpi", original_dpi))
+    try:
+        merge_shapes(fig, tolerance)
+        # Drop timestamps so repeated exports are byte-identical
+        metadata = {"svg": {"Date": None}, "pdf": {"CreationDate": None}}.get(fmt)
+        with matplotlib.rc_context(rc_params(fmt, text_to_path)):
+            fig.savefig(out, format=fmt, metadata=metadata, **save_kw)
+    finally:
+        fig.set_dpi(original_dpi)
+
+    if fmt == "svg":
+        with open(out, encoding="utf-8") as fh:
+            svg = fh.read()
+        with open(out, "w", encoding="utf-8") as fh:
+            fh.write(dedupe_svg_styles(svg))
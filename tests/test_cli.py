@@ -0,0 +1,33 @@
+import subprocess
+
+import pytest
+
+from figtab import cli
+
+
+def test_startup_within_budget():
+    best, eager = cli.measure_startup(runs=5)
+    assert not eager, f"imported at CLI startup: {', '.join(eager)}"
+    assert best <= cli.STARTUP_BUDGET_S, (
+        f"CLI cold start {best * 1000:.1f} ms > {cli.STARTUP_BUDGET_S * 1000:.0f} ms budget")
+
+
+def test_check_startup_reports_failing_child(monkeypatch):
+    def crash(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr="ImportError: boom")
+
+    monkeypatch.setattr(cli.subprocess, "run", crash)
+    assert cli.check_startup(runs=1) == 1
+
+
+def test_unknown_figure_is_rejected():
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["fig9"])
+    assert exc.value.code == 2
+
+
+@pytest.mark.parametrize("flag", [["--tolerance", "1"], ["--text-to-path"]])
+def test_lean_options_need_lean(flag):
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["fig1", "--format", "svg", *flag])
+    assert exc.value.code == 2
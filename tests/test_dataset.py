@@ -0,0 +1,52 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from figtab import dataset
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """A writable copy of figtab/data, loaded instead of the real one."""
+    copy = tmp_path / "data"
+    shutil.copytree(dataset.DATA_DIR, copy)
+    monkeypatch.setattr(dataset, "DATA_DIR", str(copy))
+    monkeypatch.setattr(dataset, "_cache", None)
+    return copy
+
+
+def _edit(table, column, values):
+    np.save(dataset.column_path(table, column), np.asarray(values))
+
+
+def test_shipped_data_is_consistent():
+    assert dataset.check(dataset.load()) == []
+
+
+def test_edited_columns_are_loaded(data_dir):
+    _edit("phases", "start", [2016, 2017, 2020, 2025, 2026])
+    assert dataset.load()["phases"]["start"][1] == 2017
+
+
+def test_fig2_titles_follow_phase_years(data_dir):
+    from matplotlib.figure import Figure
+
+    from figtab import fig2
+
+    _edit("phases", "start", [2016, 2017, 2020, 2025, 2026])
+    fig = Figure(figsize=fig2.FIGSIZE)
+    fig2.draw(fig)
+    assert "2017-2019\nPeak Engagement" in [t.get_text() for t in fig.axes[0].texts]
+
+
+def test_inconsistent_columns_are_refused(data_dir):
+    _edit("counts", "value", [21, 8, 12])
+    with pytest.raises(ValueError, match="MOU partners"):
+        dataset.load()
+
+
+def test_overlapping_phases_are_refused(data_dir):
+    _edit("phases", "end", [2016, 2020, 2022, 2025, 2026])
+    with pytest.raises(ValueError, match="overlap"):
+        dataset.load()
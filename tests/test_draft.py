@@ -0,0 +1,32 @@
+from figtab.draft import draft_path, render_drafts
+
+
+def test_draft_does_not_touch_output(tmp_path):
+    out = tmp_path / "fig2.png"
+    out.write_bytes(b"final")
+    render_drafts([("fig2", str(out), {})])
+    assert out.read_bytes() == b"final"
+    assert (tmp_path / "fig2.draft.png").exists()
+
+
+def test_refine_replaces_output_only_at_final_dpi(tmp_path):
+    out = str(tmp_path / "fig2.png")
+    writes = []
+    thread = render_drafts([("fig2", out, {})], refine=True, final_dpi=120,
+                           report=lambda name, path, dpi: writes.append((path, dpi)))
+    thread.join()
+    assert writes == [(draft_path(out), 50), (draft_path(out), 100), (out, 120)]
+    assert not (tmp_path / "fig2.draft.png").exists()
+
+
+def test_failed_refinement_is_reported(tmp_path, monkeypatch):
+    from figtab import cli, draft
+
+    def broken(fig, out, *args, **kwargs):
+        open(out, "wb").close()
+        raise OSError("disk full")
+
+    monkeypatch.setattr(draft, "save", broken)
+    status = cli.main(["fig2", "--draft", "--refine", "--dpi", "60", "--out-dir", str(tmp_path)])
+    assert status == 1
+    assert not list(tmp_path.glob("*.part.*"))
@@ -0,0 +1,22 @@
+import numpy as np
+
+from figtab.fig3_partners import load
+
+
+def test_load_pivots_quoted_names(tmp_path):
+    csv_path = tmp_path / "partners.csv"
+    csv_path.write_text(
+        "partner,year,referrals,physicians,nurses_others\n"
+        '"Hospital No. 1, Ulaanbaatar",2016,2,1,0\n'
+        '"Hospital No. 1, Ulaanbaatar",2018,3,0,1\n'
+        '"Hospital No. 1, Ulaanbaatar",2018,1,2,0\n'
+        "Khovd Regional Hospital,2017,4,1,1\n",
+        encoding="utf-8",
+    )
+    data = load(csv_path)
+
+    assert data["partners"].tolist() == ["Hospital No. 1, Ulaanbaatar", "Khovd Regional Hospital"]
+    assert data["years"].tolist() == [2016, 2017, 2018]
+    # Missing partner/year rows are zero; duplicate rows add up
+    assert np.array_equal(data["referrals"], [[2, 0, 4], [0, 4, 0]])
+    assert np.array_equal(data["physicians"], [[1, 0, 2], [0, 1, 0]])
@@ -0,0 +1,37 @@
+import json
+import re
+
+from figtab import dataset
+from figtab.html import save_html, scene
+from figtab.render import build_figure
+
+
+def test_scene_finds_fig1_aggregates():
+    counts = dataset.load()["counts"].lookup("name", "value")
+    data = json.loads(json.dumps(scene(build_figure("fig1"))))
+
+    aggregates = {item["agg"]["name"]: item["agg"]["n"]
+                  for item in data["items"] if "agg" in item}
+    assert aggregates == {
+        "Community Health Centers": counts["community_health_centers"],
+        "Specialty Centers": counts["specialty_centers"],
+        "MOU Partners": counts["mou_partners"],
+    }
+    # Each aggregate's own label is hidden once it expands
+    hidden = [item["hideIf"] for item in data["items"] if "hideIf" in item]
+    assert sorted(hidden) == sorted(i for i, item in enumerate(data["items"]) if "agg" in item)
+
+
+def test_numbered_labels_are_not_aggregates():
+    fig = build_figure("fig1")
+    fig.axes[0].text(0, 0, "5 Regional Hospitals",
+                     bbox=dict(boxstyle="round", facecolor="white"))
+    assert sum("agg" in item for item in scene(fig)["items"]) == 3
+
+
+def test_html_embeds_valid_json(tmp_path):
+    out = tmp_path / "fig1.html"
+    save_html(build_figure("fig1"), out)
+    page = out.read_text(encoding="utf-8")
+    data = json.loads(re.search(r"const SCENE = (.*);\n", page)[1])
+    assert data["items"] and len(data["bounds"]) == 4
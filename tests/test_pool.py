@@ -0,0 +1,63 @@
+import io
+
+import numpy as np
+
+from figtab import fig2, pool
+from figtab.pool import CanvasPool
+
+
+def test_released_figure_is_reused_empty():
+    canvases = CanvasPool()
+    with canvases.figure(fig2.FIGSIZE, dpi=20) as fig:
+        fig2.draw(fig)
+    reused = canvases.acquire(fig2.FIGSIZE, dpi=20)
+    assert reused is fig
+    assert not reused.axes and not reused.texts
+    assert tuple(reused.get_size_inches()) == fig2.FIGSIZE
+
+
+def test_pool_stays_bounded():
+    canvases = CanvasPool(max_idle=2)
+    figs = [canvases.acquire((4, 3 + i), dpi=20) for i in range(5)]
+    for fig in figs:
+        canvases.release(fig)
+    assert len(canvases) == 2
+
+
+def test_pooled_renders_do_not_leak():
+    rss_mb, objects = pool.leak_check("fig2", renders=200, dpi=20)
+    assert rss_mb <= pool.LEAK_BUDGET_MB
+    assert objects <= pool.LEAK_BUDGET_OBJECTS
+
+
+def test_pooled_renders_reuse_one_agg_buffer(monkeypatch):
+    from matplotlib.backends import backend_agg
+
+    allocations = []
+
+    class CountingRenderer(backend_agg.RendererAgg):
+        def __init__(self, width, height, dpi):
+            allocations.append((width, height, dpi))
+            super().__init__(width, height, dpi)
+
+    monkeypatch.setattr(backend_agg, "RendererAgg", CountingRenderer)
+    canvases = CanvasPool()
+    for _ in range(3):
+        canvases.render("fig2", io.BytesIO(), dpi=60)
+    assert allocations == [(1200, 600, 60)]
+
+
+def test_pooled_png_matches_savefig_tight():
+    import matplotlib.image as mpimg
+    from matplotlib.figure import Figure
+
+    from figtab.render import save
+
+    pooled, fresh = io.BytesIO(), io.BytesIO()
+    CanvasPool().render("fig2", pooled, dpi=60)
+    fig = Figure(figsize=fig2.FIGSIZE, dpi=60)
+    fig2.draw(fig)
+    save(fig, fresh, "png", 60)
+    pooled.seek(0)
+    fresh.seek(0)
+    assert np.array_equal(mpimg.imread(pooled), mpimg.imread(fresh))
@@ -0,0 +1,39 @@
+import io
+
+import numpy as np
+import pytest
+
+from figtab import FIGURES
+from figtab.render import build_figure, save
+
+
+def _png(name, lean):
+    import matplotlib.image as mpimg
+
+    buf = io.BytesIO()
+    save(build_figure(name), buf, "png", dpi=72, lean=lean)
+    buf.seek(0)
+    return mpimg.imread(buf, format="png")
+
+
+@pytest.mark.parametrize("name", FIGURES)
+def test_lean_png_matches_plain(name):
+    plain, lean = _png(name, False), _png(name, True)
+    assert lean.shape == plain.shape
+    assert np.abs(lean - plain).max() <= 1 / 255 + 1e-6
+
+
+def test_lean_svg_is_smaller(tmp_path):
+    plain, lean = tmp_path / "plain.svg", tmp_path / "lean.svg"
+    save(build_figure("fig1"), plain, "svg")
+    save(build_figure("fig1"), lean, "svg", lean=True)
+    assert lean.stat().st_size < plain.stat().st_size / 2
+
+
+@pytest.mark.parametrize("fmt", ["svg", "pdf"])
+def test_lean_export_is_reproducible(tmp_path, fmt):
+    first, second = tmp_path / f"a.{fmt}", tmp_path / f"b.{fmt}"
+    save(build_figure("fig2"), first, fmt, lean=True)
+    save(build_figure("fig2"), second, fmt, lean=True)
+    assert first.read_bytes() == second.read_bytes()
+    assert b"CreationDate" not in first.read_bytes()
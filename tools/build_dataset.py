@@ -0,0 +1,49 @@
+"""One-off: write the original figure data out as figtab/data/*.npy.
+
+The ``.npy`` columns are the source of truth; this script only records
+where their values came from. Running it again overwrites any later edits
+to the columns.
+"""
+
+import sys
+
+import numpy as np
+
+from figtab import dataset
+
+SOURCE = {
+    # Figure 3: per-year network growth and training
+    "network": {
+        "year": list(range(2016, 2026)),
+        # cumulative number of MOU partner hospitals
+        "mou_cum": [2, 5, 8, 12, 12, 15, 16, 18, 20, 22],
+        # 2016補0；2017–2025來自你的表
+        "physicians": [0, 4, 18, 13, 6, 0, 4, 9, 4, 5],
+        "nurses_others": [0, 0, 0, 0, 0, 0, 1, 2, 0, 12],  # 2025: 11 nurses + 1 technician
+    },
+    # Figure 2 timeline (and the span Figure 3 must fall inside)
+    "phases": {
+        "id": ["initiation", "peak", "resilience", "scalability", "institutionalization"],
+        "start": [2016, 2019, 2020, 2025, 2026],
+        "end": [2016, 2019, 2022, 2025, 2026],
+        "x": [1.5, 3.5, 5.5, 7.5, 9.5],
+        "color": ["#90BE6D", "#F9C74F", "#F94144", "#577590", "#4361EE"],
+    },
+    # Figure 1 network counts
+    "counts": {
+        "name": ["mou_partners", "community_health_centers", "specialty_centers"],
+        "value": [22, 8, 12],
+    },
+}
+
+
+def main():
+    for table, columns in SOURCE.items():
+        for column, values in columns.items():
+            np.save(dataset.column_path(table, column), np.asarray(values))
+    print(f"📁 Wrote columns to {dataset.DATA_DIR}")
+    return dataset.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())